@@ -5,9 +5,13 @@ Generates both IDV data and insurance data in one script, ensuring all users hav
 """
 
 import argparse
+import os
 import sys
-from generate_idv_data import IDVDataGenerator, DataIngestor as IDVIngestor
-from generate_insurance_data import InsuranceDataGenerator, DataIngestor as InsuranceIngestor
+from generate_idv_data import (
+    IDVDataGenerator, DataIngestor as IDVIngestor, BATCH_COLLECTIONS, IDV_INDEXES,
+    connect_mongo, create_indexes, get_idv_db, insert_idv_batch, parse_utc_datetime, prefetch
+)
+from generate_insurance_data import InsuranceDataGenerator, DataIngestor as InsuranceIngestor, close_pg_pools
 
 
 def main():
@@ -56,47 +60,67 @@ def main():
         action='store_true',
         help='Skip OpenSearch data ingestion'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of generator processes for each step (default: CPU count)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help='Seed the IDV data generator so its values are reproducible; '
+             'timestamps are relative to the current time unless --now is given'
+    )
+    parser.add_argument(
+        '--now',
+        type=parse_utc_datetime,
+        metavar='DATETIME',
+        help='ISO 8601 reference time for the IDV timestamps (default: current time); '
+             'pin it together with --seed for identical IDV data'
+    )
     
     args = parser.parse_args()
     
+    # One pooled MongoDB client shared by both ingestion steps
+    mongo_client = connect_mongo(args.mongo_uri)
+    
     print("=" * 60)
     print("STEP 1: Generating IDV Data")
     print("=" * 60)
     
     # Generate IDV data
     try:
-        idv_generator = IDVDataGenerator()
+        idv_generator = IDVDataGenerator(seed=args.seed, now=args.now)
         print(f"Generating {args.num_users} IDV users with verifications and attempts...")
-        data = idv_generator.generate_batch(args.num_users)
-        
-        print(f"Generated:")
-        print(f"  - {len(data['user_profiles'])} users")
-        print(f"  - {len(data['verifications'])} verifications")
-        print(f"  - {len(data['attempts'])} attempts")
+        batches = idv_generator.iter_batch(args.num_users, workers=args.workers)
         
-        # Ingest to MongoDB (and optionally OpenSearch)
+        # Ingest to MongoDB (and optionally OpenSearch) as each chunk is generated
         print("\nIngesting IDV data to MongoDB...")
         if args.skip_opensearch:
-            # Connect to MongoDB only
-            from pymongo import MongoClient
-            mongo_client = MongoClient(args.mongo_uri)
-            db = mongo_client['idv_data']
+            # MongoDB only
+            db = get_idv_db(mongo_client)
             
-            # Clear existing data
-            db.user_profiles.delete_many({})
-            db.identity_verifications.delete_many({})
-            db.verification_attempts.delete_many({})
-            db.login_sessions.delete_many({})
+            # Clear existing data; dropping is cheaper than deleting every
+            # document, and the indexes are rebuilt once after the load
+            for name in IDV_INDEXES:
+                db.drop_collection(name)
             
             # Insert new data
-            db.user_profiles.insert_many(data['user_profiles'])
-            db.identity_verifications.insert_many(data['verifications'])
-            db.verification_attempts.insert_many(data['attempts'])
-            if data.get('login_sessions'):
-                db.login_sessions.insert_many(data['login_sessions'])
-                print(f"Inserted {len(data['login_sessions'])} login sessions into MongoDB")
+            counts = dict.fromkeys(BATCH_COLLECTIONS, 0)
+            for batch in prefetch(batches):
+                insert_idv_batch(db, batch)
+                for key in counts:
+                    counts[key] += len(batch[key])
+            print(f"Inserted {counts['login_sessions']} login sessions into MongoDB")
             
-            mongo_client.close()
+            # The collections were dropped above, so an index that can't be
+            # built now stays missing for the rest of the stack
+            try:
+                create_indexes(db)
+            except RuntimeError as e:
+                print(f"✗ MongoDB indexes incomplete: {e}")
+                sys.exit(1)
             print("✓ IDV data ingested to MongoDB")
         else:
             idv_ingestor = IDVIngestor(
@@ -104,11 +128,18 @@ def main():
                 args.opensearch_host,
                 args.opensearch_port,
                 args.opensearch_user,
-                args.opensearch_password
+                args.opensearch_password,
+                mongo_client=mongo_client
             )
-            idv_ingestor.ingest_data(data)
+            counts = idv_ingestor.ingest_batches(batches)
+            idv_ingestor.close()
             print("✓ IDV data ingested to MongoDB and OpenSearch")
         
+        print(f"Generated:")
+        print(f"  - {counts['user_profiles']} users")
+        print(f"  - {counts['verifications']} verifications")
+        print(f"  - {counts['attempts']} attempts")
+        
     except Exception as e:
         print(f"✗ Error generating IDV data: {e}")
         sys.exit(1)
@@ -120,25 +151,39 @@ def main():
     # Generate insurance data for all IDV users
     try:
         print("Connecting to databases...")
-        insurance_ingestor = InsuranceIngestor(args.mongo_uri, args.postgres_uri)
+        insurance_ingestor = InsuranceIngestor(args.mongo_uri, args.postgres_uri, mongo_client=mongo_client)
         
         # Clear existing insurance data
         print("Clearing existing insurance data from PostgreSQL...")
-        cursor = insurance_ingestor.pg_conn.cursor()
-        cursor.execute("TRUNCATE TABLE payments, dependents, claims, policies, customers RESTART IDENTITY CASCADE")
+        insurance_ingestor.pg_cursor.execute(
+            "TRUNCATE TABLE payments, dependents, claims, policies, customers RESTART IDENTITY CASCADE"
+        )
         insurance_ingestor.pg_conn.commit()
-        cursor.close()
         print("✓ PostgreSQL cleared")
         
-        print(f"Generating insurance data for all {args.num_users} IDV users...")
-        insurance_ingestor.generate_and_insert_all(max_customers=None)
+        # Tables are empty now, so build indexes and check foreign keys once
+        # after the load instead of on every inserted row
+        saved_constraints = insurance_ingestor.drop_load_constraints()
+        try:
+            print(f"Generating insurance data for all {args.num_users} IDV users...")
+            insurance_ingestor.generate_and_insert_all(max_customers=None, workers=args.workers)
+        finally:
+            insurance_ingestor.pg_conn.rollback()
+            print("Rebuilding PostgreSQL indexes and foreign keys...")
+            problems = insurance_ingestor.restore_load_constraints(saved_constraints)
         
         insurance_ingestor.close()
+        if problems:
+            print(f"✗ {len(problems)} PostgreSQL indexes/constraints could not be fully restored (see above)")
+            sys.exit(1)
         print("✓ Insurance data generation complete")
         
     except Exception as e:
         print(f"✗ Error generating insurance data: {e}")
         sys.exit(1)
+    finally:
+        close_pg_pools()
+        mongo_client.close()
     
     print("\n" + "=" * 60)
     print("✓ ALL DATA GENERATION COMPLETE")
@@ -9,22 +9,25 @@ db.createCollection('login_sessions');
 db.createCollection('investigations');
 
 // Create indexes
-db.identity_verifications.createIndex({ "userId": 1 });
+db.identity_verifications.createIndex({ "userId": 1, "submittedAt": -1 });
 db.identity_verifications.createIndex({ "verificationId": 1 }, { unique: true });
 db.identity_verifications.createIndex({ "timestamp": -1 });
 db.identity_verifications.createIndex({ "status": 1 });
 
-db.verification_attempts.createIndex({ "verificationId": 1 });
+db.verification_attempts.createIndex({ "verificationId": 1, "attemptNumber": 1 });
 db.verification_attempts.createIndex({ "timestamp": -1 });
 
 db.user_profiles.createIndex({ "userId": 1 }, { unique: true });
 db.user_profiles.createIndex({ "email": 1 }, { unique: true });
 
 // Indexes for login_sessions (IP velocity tracking)
-db.login_sessions.createIndex({ "userId": 1 });
+db.login_sessions.createIndex({ "userId": 1, "timestamp": -1 });
 db.login_sessions.createIndex({ "ipAddress": 1 });
 db.login_sessions.createIndex({ "timestamp": -1 });
-db.login_sessions.createIndex({ "isHighVelocityIP": 1 });
+db.login_sessions.createIndex(
+    { "isHighVelocityIP": 1, "userId": 1 },
+    { partialFilterExpression: { "isHighVelocityIP": true } }
+);
 db.login_sessions.createIndex({ "ipAddress": 1, "userId": 1 });
 
 // Indexes for investigations
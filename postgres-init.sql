@@ -112,14 +112,14 @@ CREATE TABLE dependents (
 );
 
 -- Create indexes for better query performance
-CREATE INDEX idx_customers_user_id ON customers(user_id);
-CREATE INDEX idx_customers_customer_number ON customers(customer_number);
-CREATE INDEX idx_policies_customer_id ON policies(customer_id);
+-- (customers.user_id and customer_number are already indexed by their
+-- UNIQUE constraints)
+CREATE INDEX idx_policies_customer_id ON policies(customer_id, effective_date DESC);
 CREATE INDEX idx_policies_status ON policies(status);
-CREATE INDEX idx_claims_customer_id ON claims(customer_id);
+CREATE INDEX idx_claims_customer_id ON claims(customer_id, claim_date DESC);
 CREATE INDEX idx_claims_policy_id ON claims(policy_id);
 CREATE INDEX idx_claims_status ON claims(status);
-CREATE INDEX idx_payments_customer_id ON payments(customer_id);
+CREATE INDEX idx_payments_customer_id ON payments(customer_id, payment_date DESC);
 CREATE INDEX idx_payments_policy_id ON payments(policy_id);
 CREATE INDEX idx_dependents_customer_id ON dependents(customer_id);
 
@@ -8,463 +8,343 @@ import requests
 import json
 from datetime import datetime
 
+# orjson is optional; it only speeds up building the saved-object payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # OpenSearch Dashboards configuration
 DASHBOARDS_URL = "http://localhost:5601"
 OPENSEARCH_URL = "http://localhost:9200"
 
-def create_index_pattern():
-    """Create index pattern for idv_verifications."""
-    print("Creating index pattern...")
-    
-    index_pattern = {
-        "attributes": {
-            "title": "idv_verifications*",
-            "timeFieldName": "submittedAt"
-        }
+# (connect, read) timeout in seconds for the reachability checks
+PROBE_TIMEOUT = (2, 2)
+
+# One keep-alive session for every request
+SESSION = requests.Session()
+SESSION.headers.update({"osd-xsrf": "true", "Content-Type": "application/json"})
+
+def dumps(obj):
+    """Serialize obj to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+INDEX_PATTERN = {
+    "attributes": {
+        "title": "idv_verifications*",
+        "timeFieldName": "submittedAt"
     }
-    
-    response = requests.post(
-        f"{DASHBOARDS_URL}/api/saved_objects/index-pattern/idv_verifications",
-        headers={"osd-xsrf": "true", "Content-Type": "application/json"},
-        json=index_pattern
-    )
-    
-    if response.status_code in [200, 409]:  # 409 means it already exists
-        print("✓ Index pattern created/exists")
-        return True
-    else:
-        print(f"Error creating index pattern: {response.status_code}")
-        print(response.text)
-        return False
+}
 
-def create_visualization(vis_id, vis_config):
-    """Create a visualization in OpenSearch Dashboards."""
-    response = requests.post(
-        f"{DASHBOARDS_URL}/api/saved_objects/visualization/{vis_id}",
-        headers={"osd-xsrf": "true", "Content-Type": "application/json"},
-        json=vis_config
-    )
-    
-    if response.status_code in [200, 409]:
-        return True
-    else:
-        print(f"Error creating visualization {vis_id}: {response.status_code}")
-        return False
+# Saved visualization configs, built once at import rather than per call
 
-def create_visualizations():
-    """Create sample visualizations."""
-    print("\nCreating visualizations...")
-    
-    # 1. Verification Status Pie Chart
-    status_pie = {
+# Every visualization searches the same index with an empty query
+SEARCH_SOURCE_JSON = dumps({
+    "index": "idv_verifications",
+    "query": {"query": "", "language": "lucene"},
+    "filter": []
+})
+
+# Document count metric used by the bucketed visualizations
+COUNT_AGG = {
+    "id": "1",
+    "enabled": True,
+    "type": "count",
+    "schema": "metric",
+    "params": {}
+}
+
+def _visualization(title, description, vis_type, aggs, params):
+    """Build a saved visualization config around its aggs and chart params."""
+    return {
         "attributes": {
-            "title": "Verification Status Distribution",
-            "visState": json.dumps({
-                "title": "Verification Status Distribution",
-                "type": "pie",
-                "aggs": [
-                    {
-                        "id": "1",
-                        "enabled": True,
-                        "type": "count",
-                        "schema": "metric",
-                        "params": {}
-                    },
-                    {
-                        "id": "2",
-                        "enabled": True,
-                        "type": "terms",
-                        "schema": "segment",
-                        "params": {
-                            "field": "status",
-                            "size": 10,
-                            "order": "desc",
-                            "orderBy": "1"
-                        }
-                    }
-                ],
-                "params": {
-                    "type": "pie",
-                    "addTooltip": True,
-                    "addLegend": True,
-                    "legendPosition": "right",
-                    "isDonut": True
-                }
+            "title": title,
+            "visState": dumps({
+                "title": title,
+                "type": vis_type,
+                "aggs": aggs,
+                "params": {"type": vis_type, **params}
             }),
             "uiStateJSON": "{}",
-            "description": "Distribution of verification statuses",
+            "description": description,
             "version": 1,
             "kibanaSavedObjectMeta": {
-                "searchSourceJSON": json.dumps({
-                    "index": "idv_verifications",
-                    "query": {"query": "", "language": "lucene"},
-                    "filter": []
-                })
+                "searchSourceJSON": SEARCH_SOURCE_JSON
             }
         }
     }
-    
-    # 2. Risk Level Bar Chart
-    risk_bar = {
-        "attributes": {
-            "title": "Risk Level Distribution",
-            "visState": json.dumps({
-                "title": "Risk Level Distribution",
-                "type": "histogram",
-                "aggs": [
-                    {
-                        "id": "1",
-                        "enabled": True,
-                        "type": "count",
-                        "schema": "metric",
-                        "params": {}
-                    },
-                    {
-                        "id": "2",
-                        "enabled": True,
-                        "type": "terms",
-                        "schema": "segment",
-                        "params": {
-                            "field": "riskLevel",
-                            "size": 5,
-                            "order": "desc",
-                            "orderBy": "1"
-                        }
-                    }
-                ],
-                "params": {
-                    "type": "histogram",
-                    "grid": {"categoryLines": False},
-                    "categoryAxes": [{
-                        "id": "CategoryAxis-1",
-                        "type": "category",
-                        "position": "bottom",
-                        "show": True,
-                        "style": {},
-                        "scale": {"type": "linear"},
-                        "labels": {"show": True, "filter": True, "truncate": 100},
-                        "title": {}
-                    }],
-                    "valueAxes": [{
-                        "id": "ValueAxis-1",
-                        "name": "LeftAxis-1",
-                        "type": "value",
-                        "position": "left",
-                        "show": True,
-                        "style": {},
-                        "scale": {"type": "linear", "mode": "normal"},
-                        "labels": {"show": True, "rotate": 0, "filter": False, "truncate": 100},
-                        "title": {"text": "Count"}
-                    }],
-                    "seriesParams": [{
-                        "show": True,
-                        "type": "histogram",
-                        "mode": "stacked",
-                        "data": {"label": "Count", "id": "1"},
-                        "valueAxis": "ValueAxis-1",
-                        "drawLinesBetweenPoints": True,
-                        "lineWidth": 2,
-                        "showCircles": True
-                    }],
-                    "addTooltip": True,
-                    "addLegend": True,
-                    "legendPosition": "right",
-                    "times": [],
-                    "addTimeMarker": False
-                }
-            }),
-            "uiStateJSON": "{}",
-            "description": "Count of verifications by risk level",
-            "version": 1,
-            "kibanaSavedObjectMeta": {
-                "searchSourceJSON": json.dumps({
-                    "index": "idv_verifications",
-                    "query": {"query": "", "language": "lucene"},
-                    "filter": []
-                })
-            }
+
+def _terms_agg(field, size):
+    """Segment buckets for the top `size` values of field, ordered by count."""
+    return {
+        "id": "2",
+        "enabled": True,
+        "type": "terms",
+        "schema": "segment",
+        "params": {
+            "field": field,
+            "size": size,
+            "order": "desc",
+            "orderBy": "1"
         }
     }
-    
-    # 3. Verification Timeline
-    timeline = {
-        "attributes": {
-            "title": "Verifications Over Time",
-            "visState": json.dumps({
-                "title": "Verifications Over Time",
-                "type": "line",
-                "aggs": [
-                    {
-                        "id": "1",
-                        "enabled": True,
-                        "type": "count",
-                        "schema": "metric",
-                        "params": {}
-                    },
-                    {
-                        "id": "2",
-                        "enabled": True,
-                        "type": "date_histogram",
-                        "schema": "segment",
-                        "params": {
-                            "field": "submittedAt",
-                            "interval": "auto",
-                            "min_doc_count": 1
-                        }
-                    }
-                ],
-                "params": {
-                    "type": "line",
-                    "grid": {"categoryLines": False},
-                    "categoryAxes": [{
-                        "id": "CategoryAxis-1",
-                        "type": "category",
-                        "position": "bottom",
-                        "show": True,
-                        "style": {},
-                        "scale": {"type": "linear"},
-                        "labels": {"show": True, "filter": True, "truncate": 100},
-                        "title": {}
-                    }],
-                    "valueAxes": [{
-                        "id": "ValueAxis-1",
-                        "name": "LeftAxis-1",
-                        "type": "value",
-                        "position": "left",
-                        "show": True,
-                        "style": {},
-                        "scale": {"type": "linear", "mode": "normal"},
-                        "labels": {"show": True, "rotate": 0, "filter": False, "truncate": 100},
-                        "title": {"text": "Count"}
-                    }],
-                    "seriesParams": [{
-                        "show": True,
-                        "type": "line",
-                        "mode": "normal",
-                        "data": {"label": "Count", "id": "1"},
-                        "valueAxis": "ValueAxis-1",
-                        "drawLinesBetweenPoints": True,
-                        "lineWidth": 2,
-                        "showCircles": True
-                    }],
-                    "addTooltip": True,
-                    "addLegend": True,
-                    "legendPosition": "right",
-                    "times": [],
-                    "addTimeMarker": False
-                }
-            }),
-            "uiStateJSON": "{}",
-            "description": "Timeline of verification submissions",
-            "version": 1,
-            "kibanaSavedObjectMeta": {
-                "searchSourceJSON": json.dumps({
-                    "index": "idv_verifications",
-                    "query": {"query": "", "language": "lucene"},
-                    "filter": []
-                })
+
+def _pie_params(donut):
+    """Chart params for a pie visualization."""
+    return {
+        "addTooltip": True,
+        "addLegend": True,
+        "legendPosition": "right",
+        "isDonut": donut
+    }
+
+def _xy_params(series_type, mode):
+    """Chart params for a count-over-category chart (bar or line)."""
+    return {
+        "grid": {"categoryLines": False},
+        "categoryAxes": [{
+            "id": "CategoryAxis-1",
+            "type": "category",
+            "position": "bottom",
+            "show": True,
+            "style": {},
+            "scale": {"type": "linear"},
+            "labels": {"show": True, "filter": True, "truncate": 100},
+            "title": {}
+        }],
+        "valueAxes": [{
+            "id": "ValueAxis-1",
+            "name": "LeftAxis-1",
+            "type": "value",
+            "position": "left",
+            "show": True,
+            "style": {},
+            "scale": {"type": "linear", "mode": "normal"},
+            "labels": {"show": True, "rotate": 0, "filter": False, "truncate": 100},
+            "title": {"text": "Count"}
+        }],
+        "seriesParams": [{
+            "show": True,
+            "type": series_type,
+            "mode": mode,
+            "data": {"label": "Count", "id": "1"},
+            "valueAxis": "ValueAxis-1",
+            "drawLinesBetweenPoints": True,
+            "lineWidth": 2,
+            "showCircles": True
+        }],
+        "addTooltip": True,
+        "addLegend": True,
+        "legendPosition": "right",
+        "times": [],
+        "addTimeMarker": False
+    }
+
+# 1. Verification Status Pie Chart
+STATUS_PIE = _visualization(
+    "Verification Status Distribution",
+    "Distribution of verification statuses",
+    "pie",
+    [COUNT_AGG, _terms_agg("status", 10)],
+    _pie_params(donut=True)
+)
+
+# 2. Risk Level Bar Chart
+RISK_BAR = _visualization(
+    "Risk Level Distribution",
+    "Count of verifications by risk level",
+    "histogram",
+    [COUNT_AGG, _terms_agg("riskLevel", 5)],
+    _xy_params("histogram", "stacked")
+)
+
+# 3. Verification Timeline
+TIMELINE = _visualization(
+    "Verifications Over Time",
+    "Timeline of verification submissions",
+    "line",
+    [
+        COUNT_AGG,
+        {
+            "id": "2",
+            "enabled": True,
+            "type": "date_histogram",
+            "schema": "segment",
+            "params": {
+                "field": "submittedAt",
+                "interval": "auto",
+                "min_doc_count": 1
             }
         }
-    }
-    
-    # 4. Document Type Distribution
-    doc_type_pie = {
-        "attributes": {
-            "title": "Document Type Distribution",
-            "visState": json.dumps({
-                "title": "Document Type Distribution",
-                "type": "pie",
-                "aggs": [
-                    {
-                        "id": "1",
-                        "enabled": True,
-                        "type": "count",
-                        "schema": "metric",
-                        "params": {}
-                    },
-                    {
-                        "id": "2",
-                        "enabled": True,
-                        "type": "terms",
-                        "schema": "segment",
-                        "params": {
-                            "field": "documentType",
-                            "size": 10,
-                            "order": "desc",
-                            "orderBy": "1"
-                        }
-                    }
-                ],
-                "params": {
-                    "type": "pie",
-                    "addTooltip": True,
-                    "addLegend": True,
-                    "legendPosition": "right",
-                    "isDonut": False
-                }
-            }),
-            "uiStateJSON": "{}",
-            "description": "Distribution of document types used for verification",
-            "version": 1,
-            "kibanaSavedObjectMeta": {
-                "searchSourceJSON": json.dumps({
-                    "index": "idv_verifications",
-                    "query": {"query": "", "language": "lucene"},
-                    "filter": []
-                })
+    ],
+    _xy_params("line", "normal")
+)
+
+# 4. Document Type Distribution
+DOC_TYPE_PIE = _visualization(
+    "Document Type Distribution",
+    "Distribution of document types used for verification",
+    "pie",
+    [COUNT_AGG, _terms_agg("documentType", 10)],
+    _pie_params(donut=False)
+)
+
+# 5. Confidence Score Metric
+CONFIDENCE_METRIC = _visualization(
+    "Average Confidence Score",
+    "Average confidence score across all verifications",
+    "metric",
+    [
+        {
+            "id": "1",
+            "enabled": True,
+            "type": "avg",
+            "schema": "metric",
+            "params": {
+                "field": "confidence_score"
             }
         }
-    }
-    
-    # 5. Confidence Score Metric
-    confidence_metric = {
-        "attributes": {
-            "title": "Average Confidence Score",
-            "visState": json.dumps({
-                "title": "Average Confidence Score",
-                "type": "metric",
-                "aggs": [
-                    {
-                        "id": "1",
-                        "enabled": True,
-                        "type": "avg",
-                        "schema": "metric",
-                        "params": {
-                            "field": "confidence_score"
-                        }
-                    }
-                ],
-                "params": {
-                    "addTooltip": True,
-                    "addLegend": False,
-                    "type": "metric",
-                    "metric": {
-                        "percentageMode": False,
-                        "useRanges": False,
-                        "colorSchema": "Green to Red",
-                        "metricColorMode": "None",
-                        "colorsRange": [{"from": 0, "to": 10000}],
-                        "labels": {"show": True},
-                        "invertColors": False,
-                        "style": {
-                            "bgFill": "#000",
-                            "bgColor": False,
-                            "labelColor": False,
-                            "subText": "",
-                            "fontSize": 60
-                        }
-                    }
-                }
-            }),
-            "uiStateJSON": "{}",
-            "description": "Average confidence score across all verifications",
-            "version": 1,
-            "kibanaSavedObjectMeta": {
-                "searchSourceJSON": json.dumps({
-                    "index": "idv_verifications",
-                    "query": {"query": "", "language": "lucene"},
-                    "filter": []
-                })
+    ],
+    {
+        "addTooltip": True,
+        "addLegend": False,
+        "metric": {
+            "percentageMode": False,
+            "useRanges": False,
+            "colorSchema": "Green to Red",
+            "metricColorMode": "None",
+            "colorsRange": [{"from": 0, "to": 10000}],
+            "labels": {"show": True},
+            "invertColors": False,
+            "style": {
+                "bgFill": "#000",
+                "bgColor": False,
+                "labelColor": False,
+                "subText": "",
+                "fontSize": 60
             }
         }
     }
-    
-    visualizations = {
-        "status-pie": status_pie,
-        "risk-bar": risk_bar,
-        "timeline": timeline,
-        "doc-type-pie": doc_type_pie,
-        "confidence-metric": confidence_metric
-    }
-    
-    for vis_id, vis_config in visualizations.items():
-        if create_visualization(vis_id, vis_config):
-            print(f"✓ Created visualization: {vis_config['attributes']['title']}")
-        else:
-            print(f"✗ Failed to create visualization: {vis_id}")
+)
 
-def create_dashboard():
-    """Create main IDV dashboard."""
-    print("\nCreating dashboard...")
-    
-    dashboard = {
-        "attributes": {
-            "title": "IDV Analytics Dashboard",
-            "hits": 0,
-            "description": "Identity Verification analytics and monitoring",
-            "panelsJSON": json.dumps([
-                {
-                    "version": "2.11.1",
-                    "gridData": {"x": 0, "y": 0, "w": 24, "h": 15, "i": "1"},
-                    "panelIndex": "1",
-                    "embeddableConfig": {},
-                    "panelRefName": "panel_1"
-                },
-                {
-                    "version": "2.11.1",
-                    "gridData": {"x": 24, "y": 0, "w": 24, "h": 15, "i": "2"},
-                    "panelIndex": "2",
-                    "embeddableConfig": {},
-                    "panelRefName": "panel_2"
-                },
-                {
-                    "version": "2.11.1",
-                    "gridData": {"x": 0, "y": 15, "w": 48, "h": 15, "i": "3"},
-                    "panelIndex": "3",
-                    "embeddableConfig": {},
-                    "panelRefName": "panel_3"
-                },
-                {
-                    "version": "2.11.1",
-                    "gridData": {"x": 0, "y": 30, "w": 24, "h": 15, "i": "4"},
-                    "panelIndex": "4",
-                    "embeddableConfig": {},
-                    "panelRefName": "panel_4"
-                },
-                {
-                    "version": "2.11.1",
-                    "gridData": {"x": 24, "y": 30, "w": 24, "h": 15, "i": "5"},
-                    "panelIndex": "5",
-                    "embeddableConfig": {},
-                    "panelRefName": "panel_5"
-                }
-            ]),
-            "optionsJSON": json.dumps({
-                "useMargins": True,
-                "hidePanelTitles": False
-            }),
-            "version": 1,
-            "timeRestore": False,
-            "kibanaSavedObjectMeta": {
-                "searchSourceJSON": json.dumps({
-                    "query": {"query": "", "language": "lucene"},
-                    "filter": []
-                })
+VISUALIZATIONS = {
+    "status-pie": STATUS_PIE,
+    "risk-bar": RISK_BAR,
+    "timeline": TIMELINE,
+    "doc-type-pie": DOC_TYPE_PIE,
+    "confidence-metric": CONFIDENCE_METRIC
+}
+
+DASHBOARD = {
+    "attributes": {
+        "title": "IDV Analytics Dashboard",
+        "hits": 0,
+        "description": "Identity Verification analytics and monitoring",
+        "panelsJSON": dumps([
+            {
+                "version": "2.11.1",
+                "gridData": {"x": 0, "y": 0, "w": 24, "h": 15, "i": "1"},
+                "panelIndex": "1",
+                "embeddableConfig": {},
+                "panelRefName": "panel_1"
+            },
+            {
+                "version": "2.11.1",
+                "gridData": {"x": 24, "y": 0, "w": 24, "h": 15, "i": "2"},
+                "panelIndex": "2",
+                "embeddableConfig": {},
+                "panelRefName": "panel_2"
+            },
+            {
+                "version": "2.11.1",
+                "gridData": {"x": 0, "y": 15, "w": 48, "h": 15, "i": "3"},
+                "panelIndex": "3",
+                "embeddableConfig": {},
+                "panelRefName": "panel_3"
+            },
+            {
+                "version": "2.11.1",
+                "gridData": {"x": 0, "y": 30, "w": 24, "h": 15, "i": "4"},
+                "panelIndex": "4",
+                "embeddableConfig": {},
+                "panelRefName": "panel_4"
+            },
+            {
+                "version": "2.11.1",
+                "gridData": {"x": 24, "y": 30, "w": 24, "h": 15, "i": "5"},
+                "panelIndex": "5",
+                "embeddableConfig": {},
+                "panelRefName": "panel_5"
             }
-        },
-        "references": [
-            {"name": "panel_1", "type": "visualization", "id": "status-pie"},
-            {"name": "panel_2", "type": "visualization", "id": "risk-bar"},
-            {"name": "panel_3", "type": "visualization", "id": "timeline"},
-            {"name": "panel_4", "type": "visualization", "id": "doc-type-pie"},
-            {"name": "panel_5", "type": "visualization", "id": "confidence-metric"}
-        ]
-    }
+        ]),
+        "optionsJSON": dumps({
+            "useMargins": True,
+            "hidePanelTitles": False
+        }),
+        "version": 1,
+        "timeRestore": False,
+        "kibanaSavedObjectMeta": {
+            "searchSourceJSON": dumps({
+                "query": {"query": "", "language": "lucene"},
+                "filter": []
+            })
+        }
+    },
+    "references": [
+        {"name": "panel_1", "type": "visualization", "id": "status-pie"},
+        {"name": "panel_2", "type": "visualization", "id": "risk-bar"},
+        {"name": "panel_3", "type": "visualization", "id": "timeline"},
+        {"name": "panel_4", "type": "visualization", "id": "doc-type-pie"},
+        {"name": "panel_5", "type": "visualization", "id": "confidence-metric"}
+    ]
+}
+
+# Every saved object as (type, id, config), created together in one request
+SAVED_OBJECTS = [
+    ("index-pattern", "idv_verifications", INDEX_PATTERN),
+    *(("visualization", vis_id, vis_config) for vis_id, vis_config in VISUALIZATIONS.items()),
+    ("dashboard", "idv-dashboard", DASHBOARD)
+]
+
+def create_saved_objects():
+    """Create the index pattern, visualizations and dashboard in one bulk request."""
+    print("Creating index pattern, visualizations and dashboard...")
     
-    response = requests.post(
-        f"{DASHBOARDS_URL}/api/saved_objects/dashboard/idv-dashboard",
-        headers={"osd-xsrf": "true", "Content-Type": "application/json"},
-        json=dashboard
+    response = SESSION.post(
+        f"{DASHBOARDS_URL}/api/saved_objects/_bulk_create",
+        json=[dict(config, type=obj_type, id=obj_id) for obj_type, obj_id, config in SAVED_OBJECTS]
     )
     
-    if response.status_code in [200, 409]:
-        print("✓ Dashboard created successfully")
-        print(f"\nAccess your dashboard at: {DASHBOARDS_URL}/app/dashboards#/view/idv-dashboard")
-        return True
-    else:
-        print(f"Error creating dashboard: {response.status_code}")
+    if response.status_code != 200:
+        print(f"Error creating saved objects: {response.status_code}")
         print(response.text)
         return False
+    
+    # Failures are reported per object in the response body
+    errors = {
+        (obj["type"], obj["id"]): obj["error"]
+        for obj in response.json().get("saved_objects", [])
+        if "error" in obj
+    }
+    
+    created = True
+    for obj_type, obj_id, config in SAVED_OBJECTS:
+        error = errors.get((obj_type, obj_id))
+        title = config['attributes']['title']
+        if error is None:
+            print(f"✓ Created {obj_type}: {title}")
+        elif error.get("statusCode") == 409:
+            # Without overwrite the existing object is kept as it is
+            print(f"- Skipped {obj_type}: {title} (already exists, not replaced)")
+        else:
+            print(f"✗ Failed to create {obj_type} {obj_id}: {error.get('message')}")
+            created = False
+    
+    if created:
+        print(f"\nAccess your dashboard at: {DASHBOARDS_URL}/app/dashboards#/view/idv-dashboard")
+    return created
 
 def main():
     print("=" * 60)
@@ -473,7 +353,8 @@ def main():
     
     # Check if OpenSearch is accessible
     try:
-        response = requests.get(OPENSEARCH_URL)
+        # Only the status line matters, so skip the body and don't wait on a hung server
+        SESSION.get(OPENSEARCH_URL, timeout=PROBE_TIMEOUT, stream=True).close()
         print(f"✓ OpenSearch is accessible at {OPENSEARCH_URL}")
     except Exception as e:
         print(f"✗ Cannot connect to OpenSearch: {e}")
@@ -481,7 +362,7 @@ def main():
     
     # Check if Dashboards is accessible
     try:
-        response = requests.get(DASHBOARDS_URL)
+        SESSION.get(DASHBOARDS_URL, timeout=PROBE_TIMEOUT, stream=True).close()
         print(f"✓ OpenSearch Dashboards is accessible at {DASHBOARDS_URL}")
     except Exception as e:
         print(f"✗ Cannot connect to OpenSearch Dashboards: {e}")
@@ -489,7 +370,7 @@ def main():
     
     # Verify data exists
     try:
-        response = requests.get(f"{OPENSEARCH_URL}/idv_verifications/_count")
+        response = SESSION.get(f"{OPENSEARCH_URL}/idv_verifications/_count")
         count = response.json().get('count', 0)
         print(f"✓ Found {count} documents in idv_verifications index")
         if count == 0:
@@ -497,7 +378,7 @@ def main():
             print()
         
         # Get a sample document to verify field names
-        response = requests.get(f"{OPENSEARCH_URL}/idv_verifications/_search?size=1")
+        response = SESSION.get(f"{OPENSEARCH_URL}/idv_verifications/_search?size=1")
         if response.status_code == 200:
             hits = response.json().get('hits', {}).get('hits', [])
             if hits:
@@ -508,17 +389,11 @@ def main():
     
     print()
     
-    # Create index pattern
-    if not create_index_pattern():
-        print("Failed to create index pattern. Exiting.")
+    # Create index pattern, visualizations and dashboard
+    if not create_saved_objects():
+        print("Failed to create saved objects. Exiting.")
         return
     
-    # Create visualizations
-    create_visualizations()
-    
-    # Create dashboard
-    create_dashboard()
-    
     print("\n" + "=" * 60)
     print("Setup complete!")
     print("=" * 60)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Checks for generate_idv_data.py that run without any database.
+
+Run with: python3 -m pytest test_generate_idv_data.py
+"""
+
+import json
+import hashlib
+from datetime import datetime
+
+import pytest
+
+from generate_idv_data import IDVDataGenerator, PARALLEL_MIN_USERS
+
+NOW = datetime(2025, 1, 1)
+
+
+def digest(count, workers, seed=42):
+    """md5 of the data a seeded, time-pinned run produces."""
+    data = IDVDataGenerator(seed=seed, now=NOW).generate_batch(count, workers=workers)
+    return hashlib.md5(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+@pytest.mark.parametrize('count', [300, PARALLEL_MIN_USERS + 1500])
+def test_seeded_output_is_independent_of_worker_count(count):
+    assert digest(count, 1) == digest(count, 2) == digest(count, 4)
+
+
+def test_different_seeds_differ():
+    assert digest(300, 1, seed=1) != digest(300, 1, seed=2)
@@ -5,11 +5,17 @@ Tests RabbitMQ connectivity, publishing, and consuming messages
 """
 
 import sys
-import time
 import json
 import requests
 import pika
 from datetime import datetime
+from functools import lru_cache
+
+# orjson is optional; stdlib json is used when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configuration
 RABBITMQ_HOST = 'localhost'
@@ -20,6 +26,33 @@ MANAGEMENT_URL = 'http://localhost:15672'
 TEST_QUEUE = 'test_queue'
 TEST_EXCHANGE = 'test_exchange'
 
+def encode_message(message):
+    """Serialize a test message body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(message)
+    return json.dumps(message)
+
+def decode_message(body):
+    """Parse a test message body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+@lru_cache(maxsize=None)
+def management_get(path):
+    """GET a Management API path and return its JSON, once per run.
+    
+    The tests ask for the same endpoints more than once; failed requests
+    raise and are not cached, so a later test retries them.
+    """
+    response = requests.get(
+        f"{MANAGEMENT_URL}{path}",
+        auth=(RABBITMQ_USER, RABBITMQ_PASS),
+        timeout=5
+    )
+    response.raise_for_status()
+    return response.json()
+
 def print_test(name):
     """Print test header"""
     print(f"\n{'='*60}")
@@ -40,13 +73,7 @@ def test_management_api():
     
     try:
         # Test overview endpoint
-        response = requests.get(
-            f"{MANAGEMENT_URL}/api/overview",
-            auth=(RABBITMQ_USER, RABBITMQ_PASS),
-            timeout=5
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = management_get('/api/overview')
         
         print_success(f"Management API accessible")
         print(f"  RabbitMQ Version: {data.get('rabbitmq_version', 'unknown')}")
@@ -54,13 +81,7 @@ def test_management_api():
         print(f"  Cluster Name: {data.get('cluster_name', 'unknown')}")
         
         # Test vhosts
-        response = requests.get(
-            f"{MANAGEMENT_URL}/api/vhosts",
-            auth=(RABBITMQ_USER, RABBITMQ_PASS),
-            timeout=5
-        )
-        response.raise_for_status()
-        vhosts = response.json()
+        vhosts = management_get('/api/vhosts')
         print_success(f"Found {len(vhosts)} virtual host(s)")
         
         return True
@@ -69,7 +90,10 @@ def test_management_api():
         return False
 
 def test_connection():
-    """Test basic RabbitMQ connection"""
+    """Test basic RabbitMQ connection
+    
+    Returns the open connection for the other tests to share, or None.
+    """
     print_test("RabbitMQ Connection")
     
     try:
@@ -92,61 +116,57 @@ def test_connection():
         print(f"  Product: {props.get('product', 'unknown')}")
         print(f"  Version: {props.get('version', 'unknown')}")
         
-        connection.close()
-        return True
+        channel.close()
+        return connection
     except Exception as e:
         print_error(f"Connection test failed: {e}")
-        return False
+        return None
 
-def test_publish_consume():
-    """Test publishing and consuming messages"""
+def check_publish_consume(connection):
+    """Test publishing and consuming messages on the shared connection"""
     print_test("Publish and Consume Messages")
     
+    if connection is None:
+        print_error("Publish/consume test skipped: no connection")
+        return False
+    
     try:
-        # Connect
-        credentials = pika.PlainCredentials(RABBITMQ_USER, RABBITMQ_PASS)
-        parameters = pika.ConnectionParameters(
-            host=RABBITMQ_HOST,
-            port=RABBITMQ_PORT,
-            credentials=credentials
-        )
-        connection = pika.BlockingConnection(parameters)
         channel = connection.channel()
         
         # Declare queue
         channel.queue_declare(queue=TEST_QUEUE, durable=False, auto_delete=True)
         print_success(f"Queue '{TEST_QUEUE}' declared")
         
-        # Publish test messages
+        # Publish test messages as one transaction: the publishes are written
+        # back to back and tx_commit is the single round-trip that confirms
+        # the broker has them all (pika's confirm_delivery would wait on
+        # each message instead)
         num_messages = 5
+        timestamp = datetime.now().isoformat()  # one publish time for the batch
+        channel.tx_select()
         for i in range(num_messages):
             message = {
                 'message_id': i + 1,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'content': f'Test message {i + 1}'
             }
             channel.basic_publish(
                 exchange='',
                 routing_key=TEST_QUEUE,
-                body=json.dumps(message)
+                body=encode_message(message)
             )
+        channel.tx_commit()
         
         print_success(f"Published {num_messages} messages")
         
-        # Consume messages
+        # Consume messages: the transaction is committed, so they are all
+        # queued already and basic_get drains them without waiting
         received_messages = []
-        
-        def callback(ch, method, properties, body):
-            message = json.loads(body)
-            received_messages.append(message)
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-        
-        channel.basic_consume(queue=TEST_QUEUE, on_message_callback=callback)
-        
-        # Process messages with timeout
-        start_time = time.time()
-        while len(received_messages) < num_messages and (time.time() - start_time) < 5:
-            connection.process_data_events(time_limit=1)
+        while len(received_messages) < num_messages:
+            method, properties, body = channel.basic_get(queue=TEST_QUEUE, auto_ack=True)
+            if method is None:
+                break
+            received_messages.append(decode_message(body))
         
         print_success(f"Consumed {len(received_messages)} messages")
         
@@ -156,7 +176,7 @@ def test_publish_consume():
         
         # Cleanup
         channel.queue_delete(queue=TEST_QUEUE)
-        connection.close()
+        channel.close()
         
         if len(received_messages) == num_messages:
             print_success("All messages received correctly")
@@ -169,18 +189,15 @@ def test_publish_consume():
         print_error(f"Publish/consume test failed: {e}")
         return False
 
-def test_exchange_routing():
-    """Test exchange and routing"""
+def check_exchange_routing(connection):
+    """Test exchange and routing on the shared connection"""
     print_test("Exchange and Routing")
     
+    if connection is None:
+        print_error("Exchange routing test skipped: no connection")
+        return False
+    
     try:
-        credentials = pika.PlainCredentials(RABBITMQ_USER, RABBITMQ_PASS)
-        parameters = pika.ConnectionParameters(
-            host=RABBITMQ_HOST,
-            port=RABBITMQ_PORT,
-            credentials=credentials
-        )
-        connection = pika.BlockingConnection(parameters)
         channel = connection.channel()
         
         # Declare exchange
@@ -208,7 +225,10 @@ def test_exchange_routing():
             )
             print_success(f"Queue '{queue_name}' bound with routing key '{routing_key}'")
         
-        # Publish messages with different routing keys
+        # Publish messages with different routing keys. With confirms on,
+        # each publish returns once the broker has routed it, so the queue
+        # counts below are final without waiting
+        channel.confirm_delivery()
         test_messages = [
             ('logs.error', 'Error message'),
             ('logs.info', 'Info message'),
@@ -224,8 +244,6 @@ def test_exchange_routing():
             print(f"  Published: {routing_key} -> {content}")
         
         # Check message counts
-        time.sleep(0.5)  # Allow messages to route
-        
         for queue_name in queues.keys():
             method = channel.queue_declare(queue=queue_name, passive=True)
             msg_count = method.method.message_count
@@ -235,7 +253,7 @@ def test_exchange_routing():
         for queue_name in queues.keys():
             channel.queue_delete(queue=queue_name)
         channel.exchange_delete(exchange=TEST_EXCHANGE)
-        connection.close()
+        channel.close()
         
         print_success("Exchange routing test completed")
         return True
@@ -262,13 +280,9 @@ def test_docker_network():
         connection.close()
         print_success("Connection via localhost:5672 successful")
         
-        # Check if we can reach management UI
-        response = requests.get(
-            f"{MANAGEMENT_URL}/api/overview",
-            auth=(RABBITMQ_USER, RABBITMQ_PASS),
-            timeout=5
-        )
-        response.raise_for_status()
+        # Check if we can reach management UI (reuses the overview already
+        # fetched by test_management_api when that succeeded)
+        management_get('/api/overview')
         print_success("Management UI accessible at localhost:15672")
         
         return True
@@ -286,13 +300,16 @@ def main():
     print(f"User: {RABBITMQ_USER}")
     print(f"Management UI: {MANAGEMENT_URL}")
     
-    results = {
-        'Management API': test_management_api(),
-        'Basic Connection': test_connection(),
-        'Publish/Consume': test_publish_consume(),
-        'Exchange Routing': test_exchange_routing(),
-        'Docker Network': test_docker_network()
-    }
+    # The messaging tests share the connection opened by test_connection
+    # (a channel each) instead of repeating the AMQP handshake
+    results = {'Management API': test_management_api()}
+    connection = test_connection()
+    results['Basic Connection'] = connection is not None
+    results['Publish/Consume'] = check_publish_consume(connection)
+    results['Exchange Routing'] = check_exchange_routing(connection)
+    results['Docker Network'] = test_docker_network()
+    if connection is not None and connection.is_open:
+        connection.close()
     
     print("\n" + "="*60)
     print("TEST SUMMARY")
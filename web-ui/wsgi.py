@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for running the web UI under gunicorn with gevent workers:
+
+    gunicorn -w 4 -k gevent --worker-connections 1000 -b 0.0.0.0:5000 wsgi:application
+"""
+
+# Patch the stdlib and psycopg2 before app imports them, so a request waiting
+# on MongoDB or PostgreSQL yields to the worker's other requests
+from gevent import monkey
+monkey.patch_all()
+
+from psycogreen.gevent import patch_psycopg
+patch_psycopg()
+
+from app import app as application